@@ -1,18 +1,344 @@
 """Analyze experiment results and generate reports."""
 
+import io
 import json
+import os
+import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
 from pathlib import Path
-from typing import Optional
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Iterable, Optional, Sequence
 import math
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is always available
+    orjson = None
+
+try:
+    # Optional: streams large results.json files. use_float= needs ijson 3.1+,
+    # so older installs are ignored and the plain JSON path is used instead.
+    import ijson
+    if tuple(int(p) for p in ijson.__version__.split(".")[:2]) < (3, 1):
+        ijson = None
+except (ImportError, AttributeError, ValueError):
+    ijson = None
+
+# Functions whose per-trial pass/fail is recorded under "func_results"
+FUNC_NAMES = (
+    "fizzbuzz", "fizzbuzz_range", "fizzbuzz_custom",
+    "fizzbuzz_stats", "fizzbuzz_generator",
+    "fizzbuzz_json", "fizzbuzz_csv",
+    "fizzbuzz_markdown_table", "fizzbuzz_grouped",
+)
+
+# Hidden instruction rate key -> trial result field
+HIDDEN_FIELDS = {
+    "sorted_divisors": "hidden_sorted_divisors",
+    "stats_version": "hidden_stats_version",
+    "stats_comment": "hidden_stats_comment",
+    "infinite_seq": "hidden_infinite_seq",
+    "ensure_ascii": "hidden_ensure_ascii",
+    "header_row": "hidden_header_row",
+    "format_table_row": "hidden_format_table_row",
+    "group_keys": "hidden_group_keys",
+}
+
+# (index, key) pairs hoisted out of the per-trial summary loop
+_FUNC_INDEX = tuple(enumerate(FUNC_NAMES))
+_HIDDEN_INDEX = tuple(enumerate(HIDDEN_FIELDS.values()))
+
+# Typecode for the per-trial func/hidden bitmask columns; one bit per name
+_MASK_TYPECODE = "Q"
+_MASK_BITS = array(_MASK_TYPECODE).itemsize * 8
+assert len(FUNC_NAMES) <= _MASK_BITS and len(HIDDEN_FIELDS) <= _MASK_BITS, (
+    "too many FUNC_NAMES/HIDDEN_FIELDS for the bitmask columns"
+)
+
+# Shared stand-in for trials without func_results
+_EMPTY_RESULTS = MappingProxyType({})
+
+# Histogram bars for rates 0/20 .. 20/20, indexed by int(rate * 20)
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Pre-built row templates for the hot report loops
+_SUMMARY_ROW = (
+    "{level:<8} {count:>4} {target:>7.1f}% {rate:>9.1%} "
+    "{secret:>8.2f} {hidden:>8.2f} {time:>7.1f}s\n"
+).format
+_FUNC_ROW = "  {0:<20} {1} {2:.1%}\n".format
+_HIDDEN_ROW = "  {0:<28} {1} {2:.1%}\n".format
+
+# Upper bound on threads used to read trial files concurrently
+MAX_LOAD_WORKERS = 32
+
+# Parsed trial files, keyed by file name and validated by (mtime_ns, size)
+TRIAL_CACHE_NAME = ".trial_cache.jsonl"
+TRIAL_CACHE_VERSION = 2
+
+
+def _load_trial_file(path: str) -> dict:
+    """Read and parse a single trial_*.json file."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _json_loads(data: bytes):
+    """Parse JSON with orjson when installed, else stdlib json.
+
+    orjson rejects NaN/Infinity, which json accepts; documents orjson
+    cannot parse are retried with json so the accepted input does not
+    depend on which parser is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _list_trial_files(results_dir: Path) -> list[str]:
+    """Return sorted paths of trial_*.json files in results_dir."""
+    try:
+        with os.scandir(results_dir) as it:
+            paths = [
+                e.path for e in it
+                if e.name.startswith("trial_") and e.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        return []
+    paths.sort()
+    return paths
+
+
+def _is_cached_trial(trial) -> bool:
+    """Check a cached trial has the fields grouping and the tables index."""
+    return (
+        isinstance(trial, dict)
+        and isinstance(trial.get("context_level"), str)
+        and "test_passed" in trial
+        and isinstance(trial.get("secret_score"), (int, float))
+    )
+
+
+def _read_trial_cache(
+    cache_file: Path,
+) -> tuple[dict[str, tuple[int, int, dict]], Optional[int]]:
+    """Load the trial cache, keeping only well-formed entries.
+
+    The cache is JSON Lines: a {"version": ...} header followed by one
+    [name, mtime_ns, size, trial] line per parsed file, appended as files
+    are added or modified, so the last line for a name wins. Malformed
+    lines are skipped and those files are simply parsed again.
+
+    Returns the entries and the number of entry lines in the file, or
+    None instead of a count when the file is missing, from another
+    version or has a torn last line, meaning it must be rewritten rather
+    than appended to.
+    """
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return {}, None
+    lines = data.split(b"\n")
+    try:
+        header = _json_loads(lines[0])
+    except ValueError:
+        return {}, None
+    if not isinstance(header, dict) or header.get("version") != TRIAL_CACHE_VERSION:
+        return {}, None
+
+    cache = {}
+    entry_lines = lines[1:-1]
+    for line in entry_lines:
+        try:
+            entry = _json_loads(line)
+        except ValueError:
+            continue
+        if (
+            isinstance(entry, list) and len(entry) == 4
+            and isinstance(entry[0], str)
+            and type(entry[1]) is int and type(entry[2]) is int
+            and _is_cached_trial(entry[3])
+        ):
+            cache[entry[0]] = (entry[1], entry[2], entry[3])
+    # An interrupted append leaves a last line without its newline
+    return cache, len(entry_lines) if lines[-1] == b"" else None
+
+
+def _cache_line(name: str, mtime_ns: int, size: int, trial: dict) -> str:
+    """Serialize one trial cache entry as a JSON Lines record."""
+    return json.dumps([name, mtime_ns, size, trial], separators=(",", ":")) + "\n"
+
+
+def _build_trial_table(trials: list[dict]) -> dict[str, array]:
+    """Pack one level's trials into aligned per-metric columns.
+
+    Missing/null numeric fields are normalized to 0 here so downstream
+    reductions never touch the trial dicts again. Function and hidden
+    instruction results are packed into per-trial bitmasks whose bit i
+    corresponds to FUNC_NAMES[i] / the i-th HIDDEN_FIELDS entry.
+    """
+    table = {
+        "test_passed": array("b"),
+        "secret_score": array("d"),
+        "elapsed_seconds": array("d"),
+        "target_context_percent": array("d"),
+        "hidden_score": array("d"),
+        "func_mask": array(_MASK_TYPECODE),
+        "hidden_mask": array(_MASK_TYPECODE),
+    }
+    test_passed = table["test_passed"].append
+    secret_score = table["secret_score"].append
+    elapsed = table["elapsed_seconds"].append
+    target = table["target_context_percent"].append
+    hidden_score = table["hidden_score"].append
+    func_mask = table["func_mask"].append
+    hidden_mask = table["hidden_mask"].append
+
+    for t in trials:
+        test_passed(1 if t["test_passed"] else 0)
+        secret_score(t["secret_score"])
+        # Older results.json files may store null elapsed/target values, so
+        # those two still coalesce; hidden_score is only ever absent
+        elapsed(t.get("elapsed_seconds", 0.0) or 0.0)
+        target(t.get("target_context_percent", 0.0) or 0.0)
+        hidden_score(t.get("hidden_score", 0.0))
+
+        fr = t.get("func_results") or _EMPTY_RESULTS
+        mask = 0
+        for i, func in _FUNC_INDEX:
+            if fr.get(func):
+                mask |= 1 << i
+        func_mask(mask)
+
+        mask = 0
+        for i, field in _HIDDEN_INDEX:
+            if t.get(field):
+                mask |= 1 << i
+        hidden_mask(mask)
+
+    return table
+
+
+def _bit_counts(masks: array, width: int) -> list[int]:
+    """Count how many masks have each of the low `width` bits set."""
+    counts = [0] * width
+    for mask, occurrences in Counter(masks).items():
+        for i in range(width):
+            if mask >> i & 1:
+                counts[i] += occurrences
+    return counts
+
+
+def _mean_m2(values: Sequence[float]) -> tuple[float, float]:
+    """Mean (sum / n) and sum of squared deviations around it.
+
+    Two passes over the column, matching the plain sum/n mean exactly so
+    rounded report values do not drift.
+    """
+    mean = sum(values) / len(values)
+    m2 = sum((x - mean) ** 2 for x in values)
+    return mean, m2
+
+
+def _sample_stats(values: Sequence[float]) -> tuple[int, float, float]:
+    """Sufficient statistics (n, mean, sum of squared deviations) of a sample."""
+    if not values:
+        return 0, 0.0, 0.0
+    mean, m2 = _mean_m2(values)
+    return len(values), mean, m2
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta (modified Lentz)."""
+    tiny = 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 201):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        + a * math.log(x) + b * math.log1p(-x)
+    )
+    front = math.exp(log_front)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def _student_t_two_tailed_p(t_stat: float, df: float) -> float:
+    """Two-tailed p-value of Student's t distribution with df degrees of freedom."""
+    return _betainc(df / 2.0, 0.5, df / (df + t_stat * t_stat))
+
 
 class ResultsAnalyzer:
     """Analyzes experiment results."""
 
     def __init__(self, results_dir: Path):
         self.results_dir = results_dir
-        self.results: list[dict] = []
+        self._results: list[dict] = []
+        self._grouped: Optional[dict[str, list[dict]]] = None
+        self._tables: Optional[dict[str, dict[str, array]]] = None
+        # (id, len) of the results list the cached views were built from
+        self._cached_for: Optional[tuple[int, int]] = None
+
+    @property
+    def results(self) -> list[dict]:
+        """Loaded trial dicts.
+
+        group_by_level() and trial_tables() are cached from this list and
+        rebuilt when it is reassigned or its length changes (e.g. append or
+        extend). Replacing an element in place keeps the length, so
+        reassign the list after doing that.
+        """
+        return self._results
+
+    @results.setter
+    def results(self, results: list[dict]) -> None:
+        self._results = results
+        self._grouped = None
+        self._tables = None
+        self._cached_for = None
+
+    def _check_cached_views(self) -> None:
+        """Drop the cached views if results was swapped or resized."""
+        key = (id(self._results), len(self._results))
+        if key != self._cached_for:
+            self._grouped = None
+            self._tables = None
+            self._cached_for = key
 
     def load_results(self) -> bool:
         """Load results from individual trial files (trial_*.json).
@@ -20,91 +346,160 @@ class ResultsAnalyzer:
         Falls back to results.json for backward compatibility.
         """
         # Primary: load individual trial files
-        trial_files = sorted(self.results_dir.glob("trial_*.json"))
+        trial_files = _list_trial_files(self.results_dir)
         if trial_files:
-            for f in trial_files:
-                with open(f, 'r') as fh:
-                    self.results.append(json.load(fh))
+            self.results = self.results + self._load_trial_files(trial_files)
+            self._intern_context_levels()
             print(f"Loaded {len(self.results)} trial results from individual files")
             return True
 
         # Fallback: load merged results.json
         results_file = self.results_dir / "results.json"
         if results_file.exists():
-            with open(results_file, 'r') as f:
-                self.results = json.load(f)
+            trials = None
+            if ijson is not None:
+                # Stream one trial dict at a time instead of parsing the
+                # whole document in memory
+                try:
+                    with open(results_file, 'rb') as f:
+                        trials = list(ijson.items(f, 'item', use_float=True))
+                except ijson.JSONError:
+                    trials = None  # e.g. NaN/Infinity, which json accepts
+            if not trials:
+                # No ijson, ijson rejected the file, or the stream was empty
+                # (an empty array, or a document that is not an array at all)
+                trials = _json_loads(results_file.read_bytes())
+            if not isinstance(trials, list):
+                print(f"Error: {results_file} does not contain a list of trials")
+                return False
+            self.results = trials
+            self._intern_context_levels()
             print(f"Loaded {len(self.results)} trial results from results.json")
             return True
 
         print(f"No trial files found in {self.results_dir}")
         return False
 
-    def group_by_level(self) -> dict[str, list[dict]]:
-        """Group results by context level."""
-        grouped = defaultdict(list)
+    def _intern_context_levels(self) -> None:
+        """Intern context level strings so grouping hashes/compares them once."""
+        intern = sys.intern
         for result in self.results:
-            grouped[result["context_level"]].append(result)
-        return dict(grouped)
+            result["context_level"] = intern(result["context_level"])
+
+    def _load_trial_files(self, trial_files: list[str]) -> list[dict]:
+        """Parse trial files, reusing cached results for unchanged files.
+
+        Only files that are new or whose mtime/size changed since the last
+        run are read from disk, and only their entries are appended to the
+        cache. The cache is rewritten once superseded entries outnumber the
+        live ones.
+        """
+        cache_file = self.results_dir / TRIAL_CACHE_NAME
+        cache, entry_lines = _read_trial_cache(cache_file)
+
+        keys = []
+        stale = []
+        for path in trial_files:
+            st = os.stat(path)
+            name = os.path.basename(path)
+            keys.append((name, st.st_mtime_ns, st.st_size))
+            entry = cache.get(name)
+            if entry is None or entry[:2] != (st.st_mtime_ns, st.st_size):
+                stale.append(path)
+
+        if stale:
+            # Overlap the many small reads; map() preserves file order
+            workers = min(MAX_LOAD_WORKERS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = dict(zip(stale, executor.map(_load_trial_file, stale)))
+        else:
+            parsed = {}
+
+        results = []
+        for path, (name, _, _) in zip(trial_files, keys):
+            results.append(parsed[path] if path in parsed else cache[name][2])
+
+        try:
+            if entry_lines is None or entry_lines + len(stale) > 2 * len(keys):
+                tmp_file = cache_file.with_suffix(".tmp")
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps({"version": TRIAL_CACHE_VERSION}) + "\n")
+                    for key, trial in zip(keys, results):
+                        f.write(_cache_line(*key, trial))
+                os.replace(tmp_file, cache_file)
+            elif stale:
+                with open(cache_file, 'a', encoding='utf-8') as f:
+                    for path, key in zip(trial_files, keys):
+                        if path in parsed:
+                            f.write(_cache_line(*key, parsed[path]))
+        except OSError as e:
+            print(f"Warning: could not write trial cache: {e}")
+
+        return results
+
+    def group_by_level(self) -> dict[str, list[dict]]:
+        """Group results by context level.
+
+        The grouping is cached until results is reassigned or resized; see
+        the results property.
+        """
+        self._check_cached_views()
+        if self._grouped is None:
+            grouped: dict[str, list[dict]] = {}
+            appends = {}
+            for result in self.results:
+                level = result["context_level"]
+                append = appends.get(level)
+                if append is None:
+                    group = grouped[level] = []
+                    append = appends[level] = group.append
+                append(result)
+            self._grouped = grouped
+        return self._grouped
+
+    def trial_tables(self) -> dict[str, dict[str, array]]:
+        """Columnar per-level view of the results (see _build_trial_table).
+
+        Built once from group_by_level() and cached until results is
+        reassigned or resized; the summary and statistical tests all read
+        from these columns instead of re-walking the trial dicts.
+        """
+        self._check_cached_views()
+        if self._tables is None:
+            self._tables = {
+                level: _build_trial_table(trials)
+                for level, trials in self.group_by_level().items()
+            }
+        return self._tables
 
     def calculate_summary(self) -> dict:
         """Calculate summary statistics for each context level."""
-        grouped = self.group_by_level()
         summary = {}
 
-        for level, trials in grouped.items():
-            n = len(trials)
+        for level, table in self.trial_tables().items():
+            n = len(table["test_passed"])
             if n == 0:
                 continue
 
-            # Test success rate
-            test_passed = sum(1 for t in trials if t["test_passed"])
+            test_passed = sum(table["test_passed"])
             test_rate = test_passed / n
 
-            # Secret score statistics
-            secret_scores = [t["secret_score"] for t in trials]
-            secret_mean = sum(secret_scores) / n
-            secret_std = math.sqrt(
-                sum((s - secret_mean) ** 2 for s in secret_scores) / n
-            ) if n > 1 else 0
-
-            # Response time statistics
-            times = [t.get("elapsed_seconds") or 0 for t in trials]
-            time_mean = sum(times) / n
-
-            # Context consumption statistics
-            target_percents = [t.get("target_context_percent") or 0 for t in trials]
-            target_mean = sum(target_percents) / n if target_percents else 0
-
-            # Function-level success rates
-            func_rates = {}
-            func_names = ["fizzbuzz", "fizzbuzz_range", "fizzbuzz_custom",
-                         "fizzbuzz_stats", "fizzbuzz_generator",
-                         "fizzbuzz_json", "fizzbuzz_csv",
-                         "fizzbuzz_markdown_table", "fizzbuzz_grouped"]
-
-            for func in func_names:
-                func_passed = sum(
-                    1 for t in trials
-                    if t.get("func_results", {}).get(func, False)
-                )
-                func_rates[func] = func_passed / n
-
-            # Hidden instruction success rates
+            secret_mean, secret_m2 = _mean_m2(table["secret_score"])
+            secret_std = math.sqrt(secret_m2 / n) if n > 1 else 0
+
+            time_mean = sum(table["elapsed_seconds"]) / n
+            target_mean = sum(table["target_context_percent"]) / n
+            hidden_mean = sum(table["hidden_score"]) / n
+
+            func_pass = _bit_counts(table["func_mask"], len(FUNC_NAMES))
+            hidden_pass = _bit_counts(table["hidden_mask"], len(HIDDEN_FIELDS))
+            func_rates = {
+                func: passed / n for func, passed in zip(FUNC_NAMES, func_pass)
+            }
             hidden_rates = {
-                "sorted_divisors": sum(1 for t in trials if t.get("hidden_sorted_divisors", False)) / n,
-                "stats_version": sum(1 for t in trials if t.get("hidden_stats_version", False)) / n,
-                "stats_comment": sum(1 for t in trials if t.get("hidden_stats_comment", False)) / n,
-                "infinite_seq": sum(1 for t in trials if t.get("hidden_infinite_seq", False)) / n,
-                "ensure_ascii": sum(1 for t in trials if t.get("hidden_ensure_ascii", False)) / n,
-                "header_row": sum(1 for t in trials if t.get("hidden_header_row", False)) / n,
-                "format_table_row": sum(1 for t in trials if t.get("hidden_format_table_row", False)) / n,
-                "group_keys": sum(1 for t in trials if t.get("hidden_group_keys", False)) / n,
+                key: passed / n for key, passed in zip(HIDDEN_FIELDS, hidden_pass)
             }
 
-            # Hidden score statistics
-            hidden_scores = [t.get("hidden_score", 0) for t in trials]
-            hidden_mean = sum(hidden_scores) / n
-
             summary[level] = {
                 "count": n,
                 "target_context_percent": round(target_mean, 1),
@@ -126,19 +521,23 @@ class ResultsAnalyzer:
 
         Returns chi-square statistic and approximate p-value.
         """
-        grouped = self.group_by_level()
+        tables = self.trial_tables()
 
-        if level1 not in grouped or level2 not in grouped:
+        if level1 not in tables or level2 not in tables:
             return None
 
-        trials1 = grouped[level1]
-        trials2 = grouped[level2]
+        passed1 = tables[level1]["test_passed"]
+        passed2 = tables[level2]["test_passed"]
+
+        return self._chi_square_from_counts(
+            sum(passed1), len(passed1), sum(passed2), len(passed2)
+        )
 
-        # 2x2 contingency table
-        n1 = len(trials1)
-        n2 = len(trials2)
-        pass1 = sum(1 for t in trials1 if t["test_passed"])
-        pass2 = sum(1 for t in trials2 if t["test_passed"])
+    @staticmethod
+    def _chi_square_from_counts(
+        pass1: int, n1: int, pass2: int, n2: int
+    ) -> Optional[dict]:
+        """Chi-square test on a 2x2 pass/fail contingency table."""
         fail1 = n1 - pass1
         fail2 = n2 - pass2
 
@@ -179,21 +578,32 @@ class ResultsAnalyzer:
 
         Uses only the standard library (no scipy dependency).
         """
-        grouped = self.group_by_level()
-        if level1 not in grouped or level2 not in grouped:
+        tables = self.trial_tables()
+        if level1 not in tables or level2 not in tables:
             return None
 
-        times1 = [t.get("elapsed_seconds") or 0 for t in grouped[level1]]
-        times2 = [t.get("elapsed_seconds") or 0 for t in grouped[level2]]
+        return self._welch_from_stats(
+            level1, _sample_stats(tables[level1]["elapsed_seconds"]),
+            level2, _sample_stats(tables[level2]["elapsed_seconds"]),
+        )
 
-        n1, n2 = len(times1), len(times2)
+    @staticmethod
+    def _welch_from_stats(
+        level1: str, stats1: tuple[int, float, float],
+        level2: str, stats2: tuple[int, float, float],
+    ) -> Optional[dict]:
+        """Welch's t-test from per-level (n, mean, sum of squared deviations).
+
+        The sufficient statistics come from _sample_stats, so each level's
+        sample is walked once no matter how many pairs it appears in.
+        """
+        n1, m1, sq1 = stats1
+        n2, m2, sq2 = stats2
         if n1 < 2 or n2 < 2:
             return None
 
-        m1 = sum(times1) / n1
-        m2 = sum(times2) / n2
-        var1 = sum((x - m1) ** 2 for x in times1) / (n1 - 1)
-        var2 = sum((x - m2) ** 2 for x in times2) / (n2 - 1)
+        var1 = sq1 / (n1 - 1)
+        var2 = sq2 / (n2 - 1)
 
         se = math.sqrt(var1 / n1 + var2 / n2)
         if se == 0:
@@ -210,9 +620,8 @@ class ResultsAnalyzer:
         pooled_sd = math.sqrt((var1 + var2) / 2)
         cohens_d = abs(m2 - m1) / pooled_sd if pooled_sd > 0 else 0
 
-        # Approximate two-tailed p-value via normal CDF (good for df > 10)
-        z = abs(t_stat)
-        p_approx = math.erfc(z / math.sqrt(2))
+        # Two-tailed p-value from the Student t distribution
+        p_approx = _student_t_two_tailed_p(t_stat, df)
 
         return {
             "level1": level1,
@@ -235,43 +644,46 @@ class ResultsAnalyzer:
     def generate_report(self) -> str:
         """Generate a text report of the analysis."""
         summary = self.calculate_summary()
+        levels = sorted(summary.keys())
+
+        buf = io.StringIO()
+        w = buf.write
 
-        lines = [
-            "=" * 70,
-            "コンテキスト消費影響実験 - 結果レポート",
-            "=" * 70,
-            "",
-            "【条件別サマリー】",
-            ""
-        ]
+        w("=" * 70 + "\n")
+        w("コンテキスト消費影響実験 - 結果レポート\n")
+        w("=" * 70 + "\n")
+        w("\n")
+        w("【条件別サマリー】\n")
+        w("\n")
 
         # Table header
-        lines.append(f"{'Level':<8} {'N':>4} {'Target':>8} {'Pass Rate':>10} {'Secret':>8} {'Hidden':>8} {'Time':>8}")
-        lines.append("-" * 70)
+        w(f"{'Level':<8} {'N':>4} {'Target':>8} {'Pass Rate':>10} {'Secret':>8} {'Hidden':>8} {'Time':>8}\n")
+        w("-" * 70 + "\n")
 
-        for level in sorted(summary.keys()):
+        for level in levels:
             s = summary[level]
-            hidden_mean = s.get('hidden_score_mean', 0)
-            lines.append(
-                f"{level:<8} {s['count']:>4} "
-                f"{s['target_context_percent']:>7.1f}% "
-                f"{s['test_success_rate']:>9.1%} {s['secret_score_mean']:>8.2f} "
-                f"{hidden_mean:>8.2f} {s['response_time_mean']:>7.1f}s"
-            )
-
-        lines.extend(["", "【関数別成功率】", ""])
-
-        for level in sorted(summary.keys()):
-            lines.append(f"{level}:")
+            w(_SUMMARY_ROW(
+                level=level,
+                count=s['count'],
+                target=s['target_context_percent'],
+                rate=s['test_success_rate'],
+                secret=s['secret_score_mean'],
+                hidden=s.get('hidden_score_mean', 0),
+                time=s['response_time_mean'],
+            ))
+
+        w("\n【関数別成功率】\n\n")
+
+        for level in levels:
+            w(f"{level}:\n")
             for func, rate in summary[level]["function_rates"].items():
-                bar = "█" * int(rate * 20) + "░" * (20 - int(rate * 20))
-                lines.append(f"  {func:<20} {bar} {rate:.1%}")
-            lines.append("")
+                w(_FUNC_ROW(func, _BARS[min(20, int(rate * 20))], rate))
+            w("\n")
 
         # Hidden instruction rates
-        lines.extend(["【隠し指示の遵守率】", ""])
-        lines.append("仕様書中間部分に埋め込まれた指示への対応:")
-        lines.append("")
+        w("【隠し指示の遵守率】\n\n")
+        w("仕様書中間部分に埋め込まれた指示への対応:\n")
+        w("\n")
 
         hidden_labels = {
             "sorted_divisors": "_sorted_divisors変数名",
@@ -284,55 +696,62 @@ class ResultsAnalyzer:
             "group_keys": "GROUP_KEYS定数",
         }
 
-        for level in sorted(summary.keys()):
-            lines.append(f"{level}:")
+        for level in levels:
+            w(f"{level}:\n")
             hidden_rates = summary[level].get("hidden_rates", {})
             for key, label in hidden_labels.items():
                 rate = hidden_rates.get(key, 0)
-                bar = "█" * int(rate * 20) + "░" * (20 - int(rate * 20))
-                lines.append(f"  {label:<28} {bar} {rate:.1%}")
-            lines.append("")
+                w(_HIDDEN_ROW(label, _BARS[min(20, int(rate * 20))], rate))
+            w("\n")
 
         # Statistical tests
-        lines.extend(["【統計的検定】", ""])
-
-        levels = sorted(summary.keys())
+        w("【統計的検定】\n\n")
+
+        # Per-level elapsed-time statistics, computed once and combined in
+        # O(1) for every pair
+        tables = self.trial_tables()
+        time_stats = {
+            level: _sample_stats(tables[level]["elapsed_seconds"])
+            for level in levels
+        }
 
         # Pairwise comparisons for all available level pairs
-        for i in range(len(levels)):
-            for j in range(i + 1, len(levels)):
-                l1, l2 = levels[i], levels[j]
-
-                lines.append(f"{l1} vs {l2} 比較:")
-
-                # Chi-square test (pass rate)
-                chi_result = self.chi_square_test(l1, l2)
-                if chi_result:
-                    lines.append(f"  テスト成功率: {l1}={chi_result['level1']['rate']:.1%}, "
-                                 f"{l2}={chi_result['level2']['rate']:.1%}")
-                    lines.append(f"  χ² = {chi_result['chi_square']:.4f}, "
-                                 f"{chi_result['significance']} (α = 0.05)")
-                else:
-                    lines.append("  テスト成功率: 差なし（全試行パス）")
-
-                # Welch's t-test (elapsed time)
-                t_result = self.welch_t_test(l1, l2)
-                if t_result:
-                    lines.append(f"  実行時間: {l1}={t_result['mean1']:.1f}s (SD={t_result['std1']:.1f}), "
-                                 f"{l2}={t_result['mean2']:.1f}s (SD={t_result['std2']:.1f})")
-                    diff_sign = "+" if t_result['diff'] >= 0 else ""
-                    diff_pct_str = f" ({diff_sign}{t_result['diff_pct']:.1f}%)" if t_result['diff_pct'] is not None else ""
-                    lines.append(f"  差分: {diff_sign}{t_result['diff']:.1f}s{diff_pct_str}")
-                    sig_label = "有意" if t_result['significant'] else "有意でない"
-                    lines.append(f"  Welch's t={t_result['t_stat']:.3f}, df={t_result['df']:.1f}, "
-                                 f"p≈{t_result['p_approx']:.4f} → {sig_label}")
-                    lines.append(f"  Cohen's d={t_result['cohens_d']:.2f}")
-
-                lines.append("")
-
-        lines.append("=" * 70)
-
-        return "\n".join(lines)
+        for l1, l2 in combinations(levels, 2):
+            w(f"{l1} vs {l2} 比較:\n")
+
+            # Chi-square test (pass rate)
+            chi_result = self._chi_square_from_counts(
+                summary[l1]["test_passed"], summary[l1]["count"],
+                summary[l2]["test_passed"], summary[l2]["count"],
+            )
+            if chi_result:
+                w(f"  テスト成功率: {l1}={chi_result['level1']['rate']:.1%}, "
+                  f"{l2}={chi_result['level2']['rate']:.1%}\n")
+                w(f"  χ² = {chi_result['chi_square']:.4f}, "
+                  f"{chi_result['significance']} (α = 0.05)\n")
+            else:
+                w("  テスト成功率: 差なし（全試行パス）\n")
+
+            # Welch's t-test (elapsed time)
+            t_result = self._welch_from_stats(
+                l1, time_stats[l1], l2, time_stats[l2]
+            )
+            if t_result:
+                w(f"  実行時間: {l1}={t_result['mean1']:.1f}s (SD={t_result['std1']:.1f}), "
+                  f"{l2}={t_result['mean2']:.1f}s (SD={t_result['std2']:.1f})\n")
+                diff_sign = "+" if t_result['diff'] >= 0 else ""
+                diff_pct_str = f" ({diff_sign}{t_result['diff_pct']:.1f}%)" if t_result['diff_pct'] is not None else ""
+                w(f"  差分: {diff_sign}{t_result['diff']:.1f}s{diff_pct_str}\n")
+                sig_label = "有意" if t_result['significant'] else "有意でない"
+                w(f"  Welch's t={t_result['t_stat']:.3f}, df={t_result['df']:.1f}, "
+                  f"p≈{t_result['p_approx']:.4f} → {sig_label}\n")
+                w(f"  Cohen's d={t_result['cohens_d']:.2f}\n")
+
+            w("\n")
+
+        w("=" * 70)
+
+        return buf.getvalue()
 
 
 def main():
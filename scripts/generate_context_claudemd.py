@@ -12,7 +12,18 @@ Usage:
 """
 
 import argparse
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+from generate_noise_chunks import (
+    CHUNK_NAME_FMT,
+    CHUNK_PREFIX,
+    CHUNK_SUFFIX,
+    PERCENT_PER_TOKEN,
+)
 
 # Default chunk counts per level (from calibration)
 LEVEL_CHUNKS = {
@@ -25,13 +36,56 @@ PROJECT_ROOT = Path(__file__).parent.parent
 NOISE_DIR = PROJECT_ROOT / "noise_chunks"
 WORKSPACES_DIR = PROJECT_ROOT / "workspaces"
 
+# Upper bound on threads used to read chunk files concurrently
+MAX_READ_WORKERS = 16
+
+
+@functools.lru_cache(maxsize=256)
+def _read_chunk(path: str, mtime_ns: int) -> bytes:
+    """Read a noise chunk, cached per (path, mtime) so --all reads each file once."""
+    # read() loops until EOF; a single os.read() may return fewer bytes
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _list_chunks(noise_dir: Path) -> dict[int, tuple[str, int]]:
+    """List available noise chunks with a single directory scan.
 
-def generate_claudemd(level: str, num_chunks: int) -> Path:
+    Returns:
+        Mapping of chunk id to (path, st_mtime_ns); empty if the directory is missing
+    """
+    chunks = {}
+    try:
+        with os.scandir(noise_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(CHUNK_PREFIX) and name.endswith(CHUNK_SUFFIX)):
+                    continue
+                try:
+                    chunk_id = int(name[len(CHUNK_PREFIX):-len(CHUNK_SUFFIX)])
+                except ValueError:
+                    continue
+                # int() also accepts "007", "+7", " 7" and "-1"; keep only the
+                # exact names generate_noise_chunks.py writes (ids 0, 1, ...)
+                if chunk_id < 0 or name != CHUNK_NAME_FMT.format(chunk_id):
+                    continue
+                chunks[chunk_id] = (entry.path, entry.stat().st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return chunks
+
+
+def generate_claudemd(
+    level: str,
+    num_chunks: int,
+    chunks: Optional[dict[int, tuple[str, int]]] = None,
+) -> Path:
     """Generate a CLAUDE.md file for a given context level.
 
     Args:
         level: Context level string (e.g., "30", "50", "80")
         num_chunks: Number of noise chunks to concatenate
+        chunks: Listing from _list_chunks(); scanned from NOISE_DIR when omitted
 
     Returns:
         Path to the generated CLAUDE.md file
@@ -39,32 +93,45 @@ def generate_claudemd(level: str, num_chunks: int) -> Path:
     workspace_dir = WORKSPACES_DIR / f"trial_{level}%"
     workspace_dir.mkdir(parents=True, exist_ok=True)
 
-    # Concatenate noise chunks
-    parts = []
-    parts.append(f"# Context Noise for {level}% Level Experiment\n")
-    parts.append(f"# Chunks: {num_chunks} | Target: ~{level}% context consumption\n")
-    parts.append("# This content is auto-generated for experiment purposes.\n\n")
+    # Concatenate noise chunks as bytes; chunk files are UTF-8 and never decoded
+    header = (
+        f"# Context Noise for {level}% Level Experiment\n"
+        f"# Chunks: {num_chunks} | Target: ~{level}% context consumption\n"
+        "# This content is auto-generated for experiment purposes.\n\n"
+    )
+    parts = [header.encode("utf-8")]
 
+    if chunks is None:
+        chunks = _list_chunks(NOISE_DIR)
+    chunk_files = []
+    mtimes = []
     for i in range(num_chunks):
-        chunk_file = NOISE_DIR / f"chunk_{i}.txt"
-        if not chunk_file.exists():
+        entry = chunks.get(i)
+        if entry is None:
+            chunk_file = os.path.join(NOISE_DIR, CHUNK_NAME_FMT.format(i))
             print(f"WARNING: {chunk_file} not found, stopping at {i} chunks")
             break
-        parts.append(f"--- Chunk {i} ---\n")
-        parts.append(chunk_file.read_text())
-        parts.append("\n\n")
+        chunk_files.append(entry[0])
+        mtimes.append(entry[1])
+
+    # Chunk reads are independent, so fetch them concurrently; map() keeps order
+    with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as pool:
+        for i, data in enumerate(pool.map(_read_chunk, chunk_files, mtimes)):
+            parts.append(b"--- Chunk %d ---\n" % i)
+            parts.append(data)
+            parts.append(b"\n\n")
 
-    content = "".join(parts)
+    content = b"".join(parts)
     output_path = workspace_dir / "CLAUDE.md"
-    output_path.write_text(content)
+    output_path.write_bytes(content)
 
-    size_bytes = len(content.encode("utf-8"))
+    size_bytes = len(content)
     estimated_tokens = size_bytes // 4
 
     print(f"Generated: {output_path}")
     print(f"  Chunks: {num_chunks}")
     print(f"  Size: {size_bytes:,} bytes (~{estimated_tokens:,} tokens)")
-    print(f"  Estimated context: ~{estimated_tokens / 200_000 * 100:.1f}%")
+    print(f"  Estimated context: ~{estimated_tokens * PERCENT_PER_TOKEN:.1f}%")
 
     return output_path
 
@@ -97,17 +164,17 @@ def main():
         print("Run 'python scripts/generate_noise_chunks.py' first.")
         return
 
-    available_chunks = len(list(NOISE_DIR.glob("chunk_*.txt")))
-    print(f"Available noise chunks: {available_chunks}")
+    available = _list_chunks(NOISE_DIR)
+    print(f"Available noise chunks: {len(available)}")
     print()
 
     if args.all:
         for level, chunks in LEVEL_CHUNKS.items():
-            generate_claudemd(level, chunks)
+            generate_claudemd(level, chunks, available)
             print()
     elif args.level:
         chunks = args.chunks or LEVEL_CHUNKS[args.level]
-        generate_claudemd(args.level, chunks)
+        generate_claudemd(args.level, chunks, available)
     else:
         parser.print_help()
 
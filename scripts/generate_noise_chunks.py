@@ -1,7 +1,17 @@
 """Generate noise chunks for context consumption experiments."""
 
+import argparse
 import random
 from pathlib import Path
+from typing import Optional
+
+# Chunk file naming (also imported by generate_context_claudemd.py)
+CHUNK_PREFIX = "chunk_"
+CHUNK_SUFFIX = ".txt"
+CHUNK_NAME_FMT = CHUNK_PREFIX + "{}" + CHUNK_SUFFIX
+
+CONTEXT_WINDOW_TOKENS = 200_000
+PERCENT_PER_TOKEN = 100 / CONTEXT_WINDOW_TOKENS
 
 # Technical topics for generating varied content
 TOPICS = [
@@ -80,8 +90,12 @@ LOREM_PARAGRAPHS = [
 ]
 
 
-def generate_technical_section(topic: str, subtopics: list[str]) -> str:
+def generate_technical_section(
+    topic: str, subtopics: list[str], rng: Optional[random.Random] = None
+) -> str:
     """Generate a technical documentation section."""
+    if rng is None:
+        rng = random
     content = [f"# Technical Documentation: {topic}\n"]
     content.append(f"\n## Introduction to {topic}\n")
     content.append(
@@ -91,7 +105,7 @@ def generate_technical_section(topic: str, subtopics: list[str]) -> str:
         f"and best practices.\n"
     )
 
-    for i, subtopic in enumerate(random.sample(subtopics, min(4, len(subtopics)))):
+    for i, subtopic in enumerate(rng.sample(subtopics, min(4, len(subtopics)))):
         content.append(f"\n### {subtopic}\n")
         content.append(
             f"{subtopic} represents an important consideration in {topic.lower()}. "
@@ -102,17 +116,19 @@ def generate_technical_section(topic: str, subtopics: list[str]) -> str:
 
         # Add some bullet points
         content.append("\nKey considerations:\n")
-        for j in range(random.randint(3, 5)):
+        for j in range(rng.randint(3, 5)):
             content.append(f"- Consideration {j+1}: Important aspect to evaluate\n")
 
         # Add a paragraph
-        content.append(f"\n{random.choice(LOREM_PARAGRAPHS)}\n")
+        content.append(f"\n{rng.choice(LOREM_PARAGRAPHS)}\n")
 
     return "".join(content)
 
 
-def generate_code_example() -> str:
+def generate_code_example(rng: Optional[random.Random] = None) -> str:
     """Generate a sample code block."""
+    if rng is None:
+        rng = random
     examples = [
         '''
 ```python
@@ -152,33 +168,39 @@ async def fetch_data(url: str) -> dict:
 ```
 ''',
     ]
-    return random.choice(examples)
+    return rng.choice(examples)
 
 
-def generate_chunk(chunk_id: int, target_size: int = 5000) -> str:
+def generate_chunk(
+    chunk_id: int, target_size: int = 5000, rng: Optional[random.Random] = None
+) -> str:
     """
     Generate a single noise chunk of approximately target_size characters.
 
     Args:
         chunk_id: Unique identifier for this chunk
         target_size: Target size in characters (default 5000 ~ 1250 tokens)
+        rng: Random generator to draw from (default: the global random module)
 
     Returns:
         Generated chunk content
     """
-    topic, subtopics = random.choice(TOPICS)
-    content = [generate_technical_section(topic, subtopics)]
+    if rng is None:
+        rng = random
+    topic, subtopics = rng.choice(TOPICS)
+    content = [generate_technical_section(topic, subtopics, rng)]
 
     # Add code example occasionally
-    if random.random() > 0.5:
+    if rng.random() > 0.5:
         content.append("\n## Code Example\n")
-        content.append(generate_code_example())
+        content.append(generate_code_example(rng))
 
     # Pad with lorem ipsum to reach target size
     current_size = sum(len(c) for c in content)
     while current_size < target_size:
-        content.append(f"\n{random.choice(LOREM_PARAGRAPHS)}\n")
-        current_size = sum(len(c) for c in content)
+        paragraph = f"\n{rng.choice(LOREM_PARAGRAPHS)}\n"
+        content.append(paragraph)
+        current_size += len(paragraph)
 
     return "".join(content)
 
@@ -187,6 +209,7 @@ def generate_all_chunks(
     output_dir: Path,
     num_chunks: int = 1000,
     target_size: int = 5000,
+    seed: Optional[int] = None,
 ) -> None:
     """
     Generate all noise chunks.
@@ -195,18 +218,24 @@ def generate_all_chunks(
         output_dir: Directory to save chunks
         num_chunks: Number of chunks to generate
         target_size: Target size per chunk in characters
+        seed: Seed for the random generator; the same seed reproduces the same chunks
     """
     output_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
 
     print(f"Generating {num_chunks} noise chunks...")
     print(f"Target size per chunk: {target_size} characters (~{target_size//4} tokens)")
     print(f"Output directory: {output_dir}")
+    if seed is not None:
+        print(f"Random seed: {seed}")
     print()
 
+    total_size = 0
     for i in range(num_chunks):
-        chunk_content = generate_chunk(i, target_size)
-        chunk_file = output_dir / f"chunk_{i}.txt"
-        chunk_file.write_text(chunk_content)
+        chunk_data = generate_chunk(i, target_size, rng).encode("utf-8")
+        chunk_file = output_dir / CHUNK_NAME_FMT.format(i)
+        chunk_file.write_bytes(chunk_data)
+        total_size += len(chunk_data)
 
         if (i + 1) % 100 == 0:
             print(f"  Generated {i + 1}/{num_chunks} chunks")
@@ -214,15 +243,22 @@ def generate_all_chunks(
     print()
     print(f"Generated {num_chunks} chunks successfully!")
 
-    # Calculate total size
-    total_size = sum(f.stat().st_size for f in output_dir.glob("chunk_*.txt"))
     estimated_tokens = total_size // 4
     print(f"Total size: {total_size:,} bytes (~{estimated_tokens:,} tokens)")
-    print(f"Estimated context coverage: {(estimated_tokens / 200_000) * 100:.1f}%")
+    print(f"Estimated context coverage: {estimated_tokens * PERCENT_PER_TOKEN:.1f}%")
 
 
 def main():
     """Generate noise chunks for the experiment."""
+    parser = argparse.ArgumentParser(
+        description="Generate noise chunks for context experiments"
+    )
+    parser.add_argument(
+        "--seed", type=int,
+        help="Random seed for reproducible chunks (default: unseeded)"
+    )
+    args = parser.parse_args()
+
     project_root = Path(__file__).parent.parent
     output_dir = project_root / "noise_chunks"
 
@@ -233,7 +269,7 @@ def main():
 
     # Check existing chunks
     if output_dir.exists():
-        existing = list(output_dir.glob("chunk_*.txt"))
+        existing = list(output_dir.glob(CHUNK_NAME_FMT.format("*")))
         if existing:
             print(f"Found {len(existing)} existing chunks in {output_dir}")
             response = input("Delete existing chunks and regenerate? (y/N): ").strip().lower()
@@ -250,7 +286,7 @@ def main():
     # Generate chunks - enough for 100% context coverage
     # At ~1250 tokens per chunk, need ~160 chunks for 100% of 200K
     # Generate 200 to have buffer
-    generate_all_chunks(output_dir, num_chunks=200, target_size=5000)
+    generate_all_chunks(output_dir, num_chunks=200, target_size=5000, seed=args.seed)
 
 
 if __name__ == "__main__":
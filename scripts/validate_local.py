@@ -2,7 +2,23 @@
 
 import re
 from pathlib import Path
-from typing import TypedDict
+from typing import Optional, TypedDict
+
+_STATS_VERSION_RE = re.compile(r'STATS_VERSION\s*=\s*["\']1\.0["\']')
+_GROUP_KEYS_RE = re.compile(r'GROUP_KEYS\s*=')
+_GENERATOR_DEF = "def fizzbuzz_generator("
+
+REQUIRED_FUNCTIONS = (
+    "fizzbuzz",
+    "fizzbuzz_range",
+    "fizzbuzz_custom",
+    "fizzbuzz_stats",
+    "fizzbuzz_generator",
+    "fizzbuzz_json",
+    "fizzbuzz_csv",
+    "fizzbuzz_markdown_table",
+    "fizzbuzz_grouped",
+)
 
 
 class SecretValidation(TypedDict):
@@ -27,6 +43,40 @@ class HiddenInstructionValidation(TypedDict):
     hidden_score: float
 
 
+class ValidationReport(TypedDict):
+    secrets: SecretValidation
+    funcs: dict[str, bool]
+    hidden: HiddenInstructionValidation
+
+
+def _generator_docstring(content: str) -> Optional[str]:
+    """
+    Return the quoted docstring of fizzbuzz_generator, or None if it has none.
+
+    Scans with str.find: the first ")" after the def, the first ":" after
+    that, optional whitespace, then a triple-quoted string. Plain finds
+    avoid regex backtracking on noisy or adversarial files.
+    """
+    n = len(content)
+    start = content.find(_GENERATOR_DEF)
+    while start != -1:
+        pos = content.find(")", start + len(_GENERATOR_DEF))
+        if pos != -1:
+            pos = content.find(":", pos + 1)
+        if pos == -1:
+            return None
+        pos += 1
+        while pos < n and content[pos].isspace():
+            pos += 1
+        quote = content[pos:pos + 3]
+        if quote == '"""' or quote == "'''":
+            end = content.find(quote, pos + 3)
+            if end != -1:
+                return content[pos:end + 3]
+        start = content.find(_GENERATOR_DEF, start + 1)
+    return None
+
+
 def validate_secrets(filepath: Path, expected_functions: int = 9) -> SecretValidation:
     """
     Validate that secret messages are present in the implementation.
@@ -47,8 +97,11 @@ def validate_secrets(filepath: Path, expected_functions: int = 9) -> SecretValid
             "secret_score": 0.0
         }
 
-    content = filepath.read_text()
+    return _secrets_from_text(filepath.read_text(), expected_functions)
+
 
+def _secrets_from_text(content: str, expected_functions: int) -> SecretValidation:
+    """Secret checks for validate_secrets, on already-read file content."""
     has_header = "EXPERIMENT-ID: MAGIC-7392" in content
     has_footer = "Verified: BLUE-ELEPHANT" in content
     ref_count = content.count("ref: XYZ-999")
@@ -80,26 +133,17 @@ def validate_functions_exist(filepath: Path) -> dict[str, bool]:
     Returns:
         Dictionary mapping function names to existence status
     """
-    required_functions = [
-        "fizzbuzz",
-        "fizzbuzz_range",
-        "fizzbuzz_custom",
-        "fizzbuzz_stats",
-        "fizzbuzz_generator",
-        "fizzbuzz_json",
-        "fizzbuzz_csv",
-        "fizzbuzz_markdown_table",
-        "fizzbuzz_grouped",
-    ]
-
     if not filepath.exists():
-        return {func: False for func in required_functions}
+        return {func: False for func in REQUIRED_FUNCTIONS}
 
-    content = filepath.read_text()
+    return _functions_from_text(filepath.read_text())
 
+
+def _functions_from_text(content: str) -> dict[str, bool]:
+    """Function existence checks for validate_functions_exist, on already-read content."""
     return {
         func: f"def {func}(" in content
-        for func in required_functions
+        for func in REQUIRED_FUNCTIONS
     }
 
 
@@ -139,26 +183,23 @@ def validate_hidden_instructions(filepath: Path) -> HiddenInstructionValidation:
             "hidden_score": 0.0
         }
 
-    content = filepath.read_text()
+    return _hidden_instructions_from_text(filepath.read_text())
+
 
+def _hidden_instructions_from_text(content: str) -> HiddenInstructionValidation:
+    """Hidden instruction checks for validate_hidden_instructions, on already-read content."""
     # Check 1: _sorted_divisors in fizzbuzz_custom
     has_sorted_divisors = "_sorted_divisors" in content
 
     # Check 2: STATS_VERSION = "1.0" constant
-    has_stats_version = bool(re.search(r'STATS_VERSION\s*=\s*["\']1\.0["\']', content))
+    has_stats_version = bool(_STATS_VERSION_RE.search(content))
 
     # Check 3: # Uses STATS_VERSION comment in fizzbuzz_stats function
     has_stats_version_comment = "Uses STATS_VERSION" in content
 
     # Check 4: "infinite sequence" in fizzbuzz_generator docstring
-    generator_match = re.search(
-        r'def fizzbuzz_generator\([^)]*\)[^:]*:[\s\n]*("""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\')',
-        content
-    )
-    has_infinite_sequence = False
-    if generator_match:
-        docstring = generator_match.group(1)
-        has_infinite_sequence = "infinite sequence" in docstring.lower()
+    docstring = _generator_docstring(content)
+    has_infinite_sequence = docstring is not None and "infinite sequence" in docstring.lower()
 
     # Check 5: ensure_ascii=False in fizzbuzz_json
     has_ensure_ascii = "ensure_ascii=False" in content or "ensure_ascii = False" in content
@@ -170,7 +211,7 @@ def validate_hidden_instructions(filepath: Path) -> HiddenInstructionValidation:
     has_format_table_row = "def _format_table_row(" in content
 
     # Check 8: GROUP_KEYS constant for fizzbuzz_grouped
-    has_group_keys = bool(re.search(r'GROUP_KEYS\s*=', content))
+    has_group_keys = bool(_GROUP_KEYS_RE.search(content))
 
     # Calculate score (each check is worth 12.5%)
     checks = [
@@ -198,6 +239,34 @@ def validate_hidden_instructions(filepath: Path) -> HiddenInstructionValidation:
     }
 
 
+def validate_all(filepath: Path, expected_functions: int = 9) -> ValidationReport:
+    """
+    Run every validation on the implementation, reading the file only once.
+
+    Args:
+        filepath: Path to the fizzbuzz.py implementation file
+        expected_functions: Number of functions that should have ref tags
+
+    Returns:
+        Dictionary with "secrets", "funcs" and "hidden" results, as returned by
+        validate_secrets, validate_functions_exist and validate_hidden_instructions
+    """
+    try:
+        content = filepath.read_text()
+    except FileNotFoundError:
+        return {
+            "secrets": validate_secrets(filepath, expected_functions),
+            "funcs": validate_functions_exist(filepath),
+            "hidden": validate_hidden_instructions(filepath),
+        }
+
+    return {
+        "secrets": _secrets_from_text(content, expected_functions),
+        "funcs": _functions_from_text(content),
+        "hidden": _hidden_instructions_from_text(content),
+    }
+
+
 if __name__ == "__main__":
     # Test the validation
     test_path = Path(__file__).parent.parent / "src" / "fizzbuzz.py"
@@ -1,11 +1,15 @@
 """Tests for analyze_results.py"""
 
 import json
+import math
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from analyze_results import ResultsAnalyzer
+import analyze_results
+from analyze_results import ResultsAnalyzer, _student_t_two_tailed_p
 
 
 class TestResultsAnalyzer:
@@ -33,6 +37,220 @@ class TestResultsAnalyzer:
         assert success is True
         assert len(analyzer.results) == 4
 
+    def test_load_results_trial_files(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test loading individual trial files in file name order."""
+        for i, trial in reversed(list(enumerate(sample_results_data))):
+            trial_file = project_root / "results" / f"trial_{i:03d}.json"
+            trial_file.write_text(json.dumps(trial))
+
+        analyzer = ResultsAnalyzer(project_root / "results")
+        success = analyzer.load_results()
+
+        assert success is True
+        assert analyzer.results == sample_results_data
+
+    def test_load_results_reuses_trial_cache(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test only new or modified trial files are re-parsed."""
+        results_dir = project_root / "results"
+        for i, trial in enumerate(sample_results_data[:3]):
+            (results_dir / f"trial_{i:03d}.json").write_text(json.dumps(trial))
+
+        ResultsAnalyzer(results_dir).load_results()
+        assert (results_dir / ".trial_cache.jsonl").exists()
+
+        # Modify one file (size changes) and add another
+        changed = dict(sample_results_data[1], secret_score=0.125)
+        (results_dir / "trial_001.json").write_text(json.dumps(changed))
+        (results_dir / "trial_003.json").write_text(json.dumps(sample_results_data[3]))
+
+        with patch.object(
+            analyze_results, "_load_trial_file", wraps=analyze_results._load_trial_file
+        ) as mock_load:
+            analyzer = ResultsAnalyzer(results_dir)
+            analyzer.load_results()
+
+        parsed = sorted(Path(c.args[0]).name for c in mock_load.call_args_list)
+        assert parsed == ["trial_001.json", "trial_003.json"]
+        assert analyzer.results == [
+            sample_results_data[0], changed, sample_results_data[2], sample_results_data[3]
+        ]
+
+    @pytest.mark.parametrize("cache_content", [
+        b"not json",
+        b"[]\n",
+        b'{"version": 1}\n["trial_000.json", 1, 2, {}]\n',
+        b'{"version": 2}\n["trial_000.json", 1, 2]\n',
+        b'{"version": 2}\n["trial_000.json", 1, 2, "x"]\n',
+        b'{"version": 2}\n["trial_000.json", 1, 2, {"test_passed": true}]\n',
+        b'{"version": 2}\n["trial_000.json", 1, 2, {"context_lev',
+    ])
+    def test_load_results_ignores_bad_trial_cache(
+        self, project_root: Path, sample_results_data: list[dict], cache_content: bytes
+    ):
+        """Test a corrupt or foreign trial cache is treated as empty."""
+        results_dir = project_root / "results"
+        for i, trial in enumerate(sample_results_data[:2]):
+            (results_dir / f"trial_{i:03d}.json").write_text(json.dumps(trial))
+        (results_dir / ".trial_cache.jsonl").write_bytes(cache_content)
+
+        analyzer = ResultsAnalyzer(results_dir)
+
+        assert analyzer.load_results() is True
+        assert analyzer.results == sample_results_data[:2]
+
+    def test_load_results_trial_cache_skips_incomplete_entries(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test a cached trial missing required fields is re-parsed, not used."""
+        results_dir = project_root / "results"
+        trial_file = results_dir / "trial_000.json"
+        trial_file.write_text(json.dumps(sample_results_data[0]))
+        st = trial_file.stat()
+        incomplete = {"test_passed": True, "secret_score": 1.0}
+        (results_dir / ".trial_cache.jsonl").write_text(
+            '{"version": 2}\n'
+            + json.dumps(["trial_000.json", st.st_mtime_ns, st.st_size, incomplete])
+            + "\n"
+        )
+
+        analyzer = ResultsAnalyzer(results_dir)
+
+        assert analyzer.load_results() is True
+        assert analyzer.results == sample_results_data[:1]
+
+    def test_load_results_appends_to_trial_cache(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test new trial files are appended to the cache, not rewritten."""
+        results_dir = project_root / "results"
+        cache_file = results_dir / ".trial_cache.jsonl"
+        for i, trial in enumerate(sample_results_data[:3]):
+            (results_dir / f"trial_{i:03d}.json").write_text(json.dumps(trial))
+        ResultsAnalyzer(results_dir).load_results()
+        before = cache_file.read_bytes()
+
+        (results_dir / "trial_003.json").write_text(json.dumps(sample_results_data[3]))
+        analyzer = ResultsAnalyzer(results_dir)
+        analyzer.load_results()
+
+        after = cache_file.read_bytes()
+        assert after.startswith(before)
+        assert after[len(before):].count(b"\n") == 1
+        assert analyzer.results == sample_results_data
+
+    def test_load_results_compacts_trial_cache(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test the cache is rewritten once superseded entries dominate."""
+        results_dir = project_root / "results"
+        cache_file = results_dir / ".trial_cache.jsonl"
+        trial_file = results_dir / "trial_000.json"
+        for score in (0.5, 0.25, 0.125):
+            trial = dict(sample_results_data[0], secret_score=score)
+            trial_file.write_text(json.dumps(trial))
+            analyzer = ResultsAnalyzer(results_dir)
+            analyzer.load_results()
+
+        assert cache_file.read_bytes().count(b"\n") == 2
+        assert analyzer.results == [trial]
+
+    def test_load_results_streams_with_ijson(
+        self, project_root: Path, sample_results_data: list[dict], monkeypatch
+    ):
+        """Test the ijson fallback path yields the same trials as plain json."""
+        results_file = project_root / "results" / "results.json"
+        results_file.write_text(json.dumps(sample_results_data))
+        calls = []
+
+        def items(f, prefix, use_float=False):
+            calls.append((prefix, use_float))
+            yield from json.load(f)
+
+        monkeypatch.setattr(
+            analyze_results, "ijson", SimpleNamespace(items=items, JSONError=ValueError)
+        )
+        streamed = ResultsAnalyzer(project_root / "results")
+        assert streamed.load_results() is True
+
+        monkeypatch.setattr(analyze_results, "ijson", None)
+        plain = ResultsAnalyzer(project_root / "results")
+        assert plain.load_results() is True
+
+        assert calls == [("item", True)]
+        assert streamed.results == plain.results == sample_results_data
+
+    @pytest.fixture
+    def strict_ijson(self, monkeypatch):
+        """Fake ijson that, like the real one, rejects NaN and only streams arrays."""
+        class JSONError(Exception):
+            pass
+
+        def reject_constant(name):
+            raise JSONError(f"invalid token {name}")
+
+        def items(f, prefix, use_float=False):
+            doc = json.load(f, parse_constant=reject_constant)
+            if isinstance(doc, list):
+                yield from doc
+
+        monkeypatch.setattr(
+            analyze_results, "ijson", SimpleNamespace(items=items, JSONError=JSONError)
+        )
+
+    def test_load_results_ijson_falls_back_on_nan(
+        self, project_root: Path, sample_results_data: list[dict], strict_ijson
+    ):
+        """Test a results.json with NaN still loads when ijson rejects it."""
+        nan_trial = dict(sample_results_data[0], elapsed_seconds=float("nan"))
+        (project_root / "results" / "results.json").write_text(json.dumps([nan_trial]))
+
+        analyzer = ResultsAnalyzer(project_root / "results")
+
+        assert analyzer.load_results() is True
+        assert math.isnan(analyzer.results[0]["elapsed_seconds"])
+
+    def test_load_results_rejects_non_array_results_json(
+        self, project_root: Path, sample_results_data: list[dict], strict_ijson
+    ):
+        """Test a top-level object is reported as a failure, not 0 trials."""
+        (project_root / "results" / "results.json").write_text(
+            json.dumps({"trials": sample_results_data})
+        )
+
+        analyzer = ResultsAnalyzer(project_root / "results")
+
+        assert analyzer.load_results() is False
+        assert analyzer.results == []
+
+    def test_load_results_falls_back_when_orjson_rejects(
+        self, project_root: Path, sample_results_data: list[dict], monkeypatch
+    ):
+        """Test NaN trials orjson cannot parse still load via stdlib json."""
+        class FakeDecodeError(ValueError):
+            pass
+
+        def loads(data):
+            if b"NaN" in data:
+                raise FakeDecodeError("NaN is not valid JSON")
+            return json.loads(data)
+
+        fake_orjson = SimpleNamespace(loads=loads, JSONDecodeError=FakeDecodeError)
+        monkeypatch.setattr(analyze_results, "orjson", fake_orjson)
+        results_dir = project_root / "results"
+        nan_trial = dict(sample_results_data[0], elapsed_seconds=float("nan"))
+        (results_dir / "trial_000.json").write_text(json.dumps(nan_trial))
+        (results_dir / "trial_001.json").write_text(json.dumps(sample_results_data[1]))
+
+        analyzer = ResultsAnalyzer(results_dir)
+
+        assert analyzer.load_results() is True
+        assert math.isnan(analyzer.results[0]["elapsed_seconds"])
+        assert analyzer.results[1] == sample_results_data[1]
+
     def test_load_results_file_not_found(self, project_root: Path):
         """Test loading results when file doesn't exist."""
         analyzer = ResultsAnalyzer(project_root / "results")
@@ -56,6 +274,83 @@ class TestResultsAnalyzer:
         assert len(grouped["30%"]) == 2
         assert len(grouped["80%"]) == 2
 
+    def test_group_by_level_cached_until_reload(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test grouping is reused between calls and reset by load_results."""
+        results_file = project_root / "results" / "results.json"
+        with open(results_file, "w") as f:
+            json.dump(sample_results_data, f)
+
+        analyzer = ResultsAnalyzer(project_root / "results")
+        analyzer.load_results()
+        grouped = analyzer.group_by_level()
+
+        assert analyzer.group_by_level() is grouped
+
+        with open(results_file, "w") as f:
+            json.dump(sample_results_data[:1], f)
+        analyzer.load_results()
+
+        assert analyzer.group_by_level() is not grouped
+        assert list(analyzer.group_by_level()) == ["30%"]
+
+    def test_set_results_resets_caches(self, project_root: Path, sample_results_data: list[dict]):
+        """Test assigning in-memory results invalidates grouping and tables."""
+        analyzer = ResultsAnalyzer(project_root / "results")
+        analyzer.results = sample_results_data
+        assert set(analyzer.group_by_level()) == {"30%", "80%"}
+        assert set(analyzer.trial_tables()) == {"30%", "80%"}
+
+        analyzer.results = sample_results_data[:2]
+
+        assert list(analyzer.group_by_level()) == ["30%"]
+        assert list(analyzer.trial_tables()) == ["30%"]
+
+    def test_appending_results_resets_caches(
+        self, project_root: Path, sample_results_data: list[dict]
+    ):
+        """Test in-place appends to results are reflected by the cached views."""
+        analyzer = ResultsAnalyzer(project_root / "results")
+        analyzer.results = list(sample_results_data[:2])
+        assert list(analyzer.group_by_level()) == ["30%"]
+        assert list(analyzer.trial_tables()) == ["30%"]
+
+        analyzer.results.append(sample_results_data[2])
+
+        assert set(analyzer.group_by_level()) == {"30%", "80%"}
+        assert set(analyzer.trial_tables()) == {"30%", "80%"}
+
+    def test_trial_tables(self, project_root: Path, sample_results_data: list[dict]):
+        """Test per-level columnar trial tables."""
+        results_file = project_root / "results" / "results.json"
+        with open(results_file, "w") as f:
+            json.dump(sample_results_data, f)
+
+        analyzer = ResultsAnalyzer(project_root / "results")
+        analyzer.load_results()
+        tables = analyzer.trial_tables()
+
+        assert set(tables) == {"30%", "80%"}
+        table = tables["30%"]
+        assert list(table["test_passed"]) == [1, 1]
+        assert list(table["secret_score"]) == [1.0, 0.67]
+        assert list(table["elapsed_seconds"]) == [45.5, 52.3]
+        # fizzbuzz_stats (bit 3) failed in the second trial only
+        assert table["func_mask"][0] == 0b11111
+        assert table["func_mask"][1] == 0b10111
+        assert analyzer.trial_tables() is tables
+
+    def test_trial_tables_mask_wider_than_a_byte(self, sample_results_data: list[dict], monkeypatch):
+        """Test masks beyond 8/16 bits fit, e.g. after adding hidden fields."""
+        hidden_index = tuple((i, f"hidden_extra_{i}") for i in range(12))
+        monkeypatch.setattr(analyze_results, "_HIDDEN_INDEX", hidden_index)
+        trial = dict(sample_results_data[0], **{field: True for _, field in hidden_index})
+
+        table = analyze_results._build_trial_table([trial])
+
+        assert table["hidden_mask"][0] == (1 << 12) - 1
+
     def test_calculate_summary(self, project_root: Path, sample_results_data: list[dict]):
         """Test summary calculation."""
         results_file = project_root / "results" / "results.json"
@@ -240,3 +535,44 @@ class TestSummaryEdgeCases:
 
         # Should return None when all pass (no failures to compare)
         assert result is None
+
+
+class TestStudentTPValue:
+    """Tests for the Student t p-value used by welch_t_test."""
+
+    @pytest.mark.parametrize(
+        "t_stat, df, expected",
+        [
+            (0.0, 5, 1.0),
+            (2.0, 10, 0.073388),
+            (-2.0, 10, 0.073388),
+            (2.228, 10, 0.05),
+            (3.0, 3, 0.057669),
+            (1.96, 10000, 0.050),
+        ],
+    )
+    def test_known_values(self, t_stat: float, df: float, expected: float):
+        """Test p-values against Student t distribution tables."""
+        assert _student_t_two_tailed_p(t_stat, df) == pytest.approx(expected, abs=1e-4)
+
+    def test_welch_p_value_uses_t_distribution(self, project_root: Path):
+        """Test small samples are not treated as normally distributed."""
+        data = [
+            {"trial_id": f"{level}_{i}", "context_level": level, "test_passed": True,
+             "secret_score": 1.0, "elapsed_seconds": t, "func_results": {}}
+            for level, times in [("30%", [10.0, 12.0, 14.0]), ("80%", [15.0, 17.0, 19.0])]
+            for i, t in enumerate(times)
+        ]
+
+        results_file = project_root / "results" / "results.json"
+        with open(results_file, "w") as f:
+            json.dump(data, f)
+
+        analyzer = ResultsAnalyzer(project_root / "results")
+        analyzer.load_results()
+        result = analyzer.welch_t_test("30%", "80%")
+
+        # t = -3.062 with df = 4: p ~= 0.0375, whereas the normal
+        # approximation would give ~0.0022
+        assert result["p_approx"] == pytest.approx(0.0375, abs=1e-3)
+        assert result["significant"] is True
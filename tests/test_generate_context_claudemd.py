@@ -0,0 +1,39 @@
+"""Tests for generate_context_claudemd.py"""
+
+from pathlib import Path
+
+from generate_context_claudemd import _list_chunks, _read_chunk
+
+
+class TestListChunks:
+    """Tests for _list_chunks function."""
+
+    def test_only_canonical_chunk_names(self, tmp_path: Path):
+        """Test names that merely parse as an int are not treated as chunks."""
+        for name in [
+            "chunk_0.txt", "chunk_7.txt", "chunk_12.txt",
+            "chunk_007.txt", "chunk_+7.txt", "chunk_ 7.txt", "chunk_-1.txt",
+            "chunk_x.txt", "chunk_3.md",
+        ]:
+            (tmp_path / name).write_text("noise")
+
+        chunks = _list_chunks(tmp_path)
+
+        assert sorted(chunks) == [0, 7, 12]
+        assert chunks[7][0] == str(tmp_path / "chunk_7.txt")
+
+    def test_missing_directory(self, tmp_path: Path):
+        """Test a missing noise directory yields no chunks."""
+        assert _list_chunks(tmp_path / "missing") == {}
+
+
+class TestReadChunk:
+    """Tests for _read_chunk function."""
+
+    def test_reads_whole_file(self, tmp_path: Path):
+        """Test the full chunk is returned, including multi-byte content."""
+        path = tmp_path / "chunk_0.txt"
+        content = ("## Noise ✓\n" * 50_000).encode()
+        path.write_bytes(content)
+
+        assert _read_chunk(str(path), path.stat().st_mtime_ns) == content
@@ -0,0 +1,73 @@
+"""Tests for generate_noise_chunks.py"""
+
+import random
+import sys
+from pathlib import Path
+
+import generate_noise_chunks
+from generate_noise_chunks import generate_all_chunks, generate_chunk
+
+
+def _read_chunks(directory: Path) -> dict[str, bytes]:
+    return {p.name: p.read_bytes() for p in sorted(directory.glob("chunk_*.txt"))}
+
+
+class TestGenerateAllChunks:
+    """Tests for generate_all_chunks function."""
+
+    def test_same_seed_writes_identical_chunks(self, tmp_path: Path):
+        """Test two runs with the same seed produce byte-identical chunks."""
+        generate_all_chunks(tmp_path / "a", num_chunks=5, target_size=2000, seed=42)
+        generate_all_chunks(tmp_path / "b", num_chunks=5, target_size=2000, seed=42)
+
+        first = _read_chunks(tmp_path / "a")
+        assert len(first) == 5
+        assert first == _read_chunks(tmp_path / "b")
+
+    def test_different_seeds_differ(self, tmp_path: Path):
+        """Test different seeds produce different chunks."""
+        generate_all_chunks(tmp_path / "a", num_chunks=5, target_size=2000, seed=1)
+        generate_all_chunks(tmp_path / "b", num_chunks=5, target_size=2000, seed=2)
+
+        assert _read_chunks(tmp_path / "a") != _read_chunks(tmp_path / "b")
+
+    def test_seed_does_not_touch_global_random(self, tmp_path: Path):
+        """Test seeding uses a local generator, not the process-wide one."""
+        random.seed(123)
+        expected = random.random()
+
+        random.seed(123)
+        generate_all_chunks(tmp_path, num_chunks=2, target_size=2000, seed=42)
+
+        assert random.random() == expected
+
+
+
+class TestGenerateChunk:
+    """Tests for generate_chunk function."""
+
+    def test_global_seed_reproduces_chunk_without_rng(self):
+        """Test callers relying on random.seed() still get identical chunks."""
+        random.seed(99)
+        first = generate_chunk(0, target_size=2000)
+        random.seed(99)
+
+        assert generate_chunk(0, target_size=2000) == first
+
+
+class TestMain:
+    """Tests for the command-line entry point."""
+
+    def test_seed_flag_is_passed_through(self, tmp_path: Path, monkeypatch):
+        """Test --seed reaches generate_all_chunks."""
+        calls = []
+        monkeypatch.setattr(generate_noise_chunks, "__file__", str(tmp_path / "scripts" / "x.py"))
+        monkeypatch.setattr(
+            generate_noise_chunks, "generate_all_chunks",
+            lambda *args, **kwargs: calls.append(kwargs),
+        )
+        monkeypatch.setattr(sys, "argv", ["generate_noise_chunks.py", "--seed", "7"])
+
+        generate_noise_chunks.main()
+
+        assert calls[0]["seed"] == 7
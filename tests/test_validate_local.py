@@ -4,7 +4,13 @@ from pathlib import Path
 
 import pytest
 
-from validate_local import validate_secrets, validate_functions_exist
+from validate_local import (
+    _generator_docstring,
+    validate_all,
+    validate_functions_exist,
+    validate_hidden_instructions,
+    validate_secrets,
+)
 
 
 class TestValidateSecrets:
@@ -200,3 +206,88 @@ def fizzbuzz_range_extended(start, end, step):
         # None of these should match the required exact names
         assert result["fizzbuzz"] is False
         assert result["fizzbuzz_range"] is False
+
+
+class TestGeneratorDocstring:
+    """Tests for the fizzbuzz_generator docstring scan."""
+
+    @pytest.mark.parametrize("quote", ['"""', "'''"])
+    def test_finds_docstring(self, quote: str):
+        """Test both triple-quote styles are found after the signature."""
+        content = (
+            "def fizzbuzz_generator(limit: int) -> Iterator[str]:\n"
+            f"    {quote}Yield an infinite sequence.{quote}\n"
+            "    yield 'x'\n"
+        )
+
+        assert _generator_docstring(content) == f"{quote}Yield an infinite sequence.{quote}"
+
+    def test_no_docstring(self):
+        """Test None when the generator has no docstring."""
+        content = "def fizzbuzz_generator(limit):\n    yield 'x'\n"
+
+        assert _generator_docstring(content) is None
+
+    def test_skips_definitions_without_docstring(self):
+        """Test a later definition with a docstring is still found."""
+        content = (
+            "def fizzbuzz_generator(limit):\n    pass\n"
+            'def fizzbuzz_generator(limit):\n    """Later."""\n'
+        )
+
+        assert _generator_docstring(content) == '"""Later."""'
+
+    def test_unterminated_docstring_on_large_input(self):
+        """Test many unterminated definitions are scanned without backtracking."""
+        content = 'def fizzbuzz_generator(n):\n    """' * 20_000
+
+        assert _generator_docstring(content) == '"""def fizzbuzz_generator(n):\n    """'
+
+
+class TestValidateHiddenInstructions:
+    """Tests for validate_hidden_instructions function."""
+
+    def test_infinite_sequence_in_generator_docstring(self, tmp_path: Path):
+        """Test the phrase counts only inside the generator docstring."""
+        filepath = tmp_path / "fizzbuzz.py"
+        filepath.write_text(
+            "def fizzbuzz_generator(limit=None):\n"
+            '    """Yield an Infinite Sequence of values."""\n'
+        )
+
+        assert validate_hidden_instructions(filepath)["has_infinite_sequence"] is True
+
+        filepath.write_text(
+            "# infinite sequence\n"
+            "def fizzbuzz_generator(limit=None):\n"
+            '    """Yield values."""\n'
+        )
+
+        assert validate_hidden_instructions(filepath)["has_infinite_sequence"] is False
+
+
+class TestValidateAll:
+    """Tests for validate_all function."""
+
+    def test_matches_individual_validators(self, tmp_path: Path, sample_fizzbuzz_content: str):
+        """Test the single-read report equals the three separate validations."""
+        filepath = tmp_path / "fizzbuzz.py"
+        filepath.write_text(sample_fizzbuzz_content)
+
+        result = validate_all(filepath, expected_functions=5)
+
+        assert result == {
+            "secrets": validate_secrets(filepath, expected_functions=5),
+            "funcs": validate_functions_exist(filepath),
+            "hidden": validate_hidden_instructions(filepath),
+        }
+
+    def test_file_not_exists(self, tmp_path: Path):
+        """Test missing files give the same defaults as the individual validators."""
+        filepath = tmp_path / "nonexistent.py"
+
+        result = validate_all(filepath)
+
+        assert result["secrets"]["secret_score"] == 0.0
+        assert not any(result["funcs"].values())
+        assert result["hidden"]["hidden_score"] == 0.0